@@ -23,9 +23,12 @@ setup(
     py_modules=['solidserver_backend'],
     install_requires=[
         'designate>=12.0.0',
+        'cachetools>=2.0.0',
         'oslo.log>=4.0.0',
         'oslo.config>=8.0.0',
+        'orjson>=3.0.0',
         'requests>=2.25.0',
+        'urllib3>=1.26.0',
     ],
     entry_points={
         'designate.backend': [
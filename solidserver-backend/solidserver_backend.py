@@ -5,9 +5,23 @@ This module implements a Designate backend driver for SOLIDserver EIP DNS servic
 It handles DNS zone and resource record management through SOLIDserver's REST API.
 """
 
+import base64
+from concurrent import futures
+import ipaddress
+import re
+import socket
+import threading
+import time
+from types import MappingProxyType
+from urllib.parse import urlsplit
+
+import cachetools
+import orjson
 import requests
-from requests.auth import HTTPBasicAuth
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.retry import Retry
 
 from oslo_log import log as logging
 from oslo_config import cfg
@@ -56,15 +70,274 @@ SOLIDSERVER_OPTS = [
         help='Default HTTP request timeout (seconds)',
         default=5,
     ),
+    cfg.BoolOpt(
+        'batch_api',
+        help='Send all records of a recordset in a single multi-RR request '
+             '(rr_entries payload). Only enable this if the SOLIDserver API '
+             'accepts batched RR payloads; if it answers HTTP 405 or 501 the '
+             'backend reverts to one request per record',
+        default=False,
+    ),
+    cfg.IntOpt(
+        'max_workers',
+        help='Maximum number of record API calls issued concurrently when a '
+             'recordset is handled record by record',
+        default=8,
+        min=1,
+    ),
+    cfg.IntOpt(
+        'dns_cache_ttl',
+        help='How long (seconds) the resolved SOLIDserver address is reused '
+             'for new connections. 0 disables the cache',
+        default=60,
+    ),
+    cfg.FloatOpt(
+        'dns_error_ttl',
+        help='How long (seconds) a failed SOLIDserver name resolution is '
+             'cached',
+        default=0.15,
+    ),
 ]
 
 CONF = cfg.CONF
 CONF.register_opts(SOLIDSERVER_OPTS, group='solidserver')
 
+# Size of the keep-alive connection pool mounted on the HTTP session. It is
+# raised to the configured number of record workers if that is larger, so
+# workers never wait for a free connection.
+HTTP_POOL_SIZE = 32
+
+# API endpoints used by the backend; their full URLs are built once per backend
+API_ENDPOINTS = (
+    '/dns/zone/add',
+    '/dns/zone/delete',
+    '/dns/zone/list',
+    '/dns/zone/count',
+    '/dns/rr/add',
+    '/dns/rr/delete',
+    '/dns/rr/patch',
+)
+
+# Endpoint and timeout (seconds) of the connectivity check. The timeout is
+# kept short, and the check never retried, so an unreachable SOLIDserver does
+# not block service startup.
+PING_ENDPOINT = '/dns/zone/count'
+PING_TIMEOUT = 5
+
+# How long (seconds) a ping result is reused. Failures are cached much more
+# briefly than successes so that recovery is noticed quickly.
+PING_CACHE_TTL = 5.0
+PING_ERROR_TTL = 0.15
+
+# Record types handled by this backend
+_SUPPORTED_TYPES = frozenset(('A', 'AAAA'))
+_UNSUPPORTED_MSG = ('Unsupported record type: %s. Only A and AAAA records '
+                    'are supported.')
+
+# In-process cache of zone name -> SOLIDserver zone_id
+ZONE_ID_CACHE_SIZE = 1024
+ZONE_ID_CACHE_TTL = 300
+
+# SOLIDserver error message reporting that the referenced zone itself does
+# not exist. Matched against whole messages so that errors about a record
+# within an existing zone are not mistaken for it.
+_ZONE_NOT_FOUND_RE = re.compile(
+    r'(?:unknown zone(?:_id)?(?: \S+)?'
+    r'|zone(?:_id)? (?:\S+ )?(?:not found|does not exist))\.?',
+    re.IGNORECASE
+)
+
+
+# HTTP statuses meaning that SOLIDserver does not implement a request, as
+# opposed to e.g. 404 which may only mean that the referenced RR is missing
+_UNSUPPORTED_STATUSES = frozenset((405, 501))
+
+# The RR patch endpoint is an optional extension: on servers without it the
+# unknown URL itself answers 404. A 404 carrying SOLIDserver error messages
+# comes from the endpoint (e.g. an RR to remove is already gone) instead.
+_PATCH_UNSUPPORTED_STATUSES = _UNSUPPORTED_STATUSES | {404}
+
+
+class EndpointNotSupported(exceptions.BackendException):
+    """SOLIDserver does not implement the request (HTTP 405/501)."""
+
+
+class ZoneNotFound(exceptions.BackendException):
+    """SOLIDserver reported that the referenced zone does not exist."""
+
+
+class _PreEncodedBasicAuth(AuthBase):
+    """HTTP Basic auth whose header value is encoded once, not per request.
+
+    Being set as `session.auth`, it also keeps requests from replacing the
+    configured credentials with a ~/.netrc entry for the host.
+    """
+
+    def __init__(self, username, password):
+        token = base64.b64encode(
+            f'{username}:{password}'.encode('utf-8')
+        ).decode('ascii')
+        self.header = f'Basic {token}'
+
+    def __call__(self, r):
+        r.headers['Authorization'] = self.header
+        return r
+
+
+class _ApiRetry(Retry):
+    """urllib3 retry policy that never re-sends a possibly applied POST.
+
+    A 502 or 504 from a gateway does not tell whether SOLIDserver processed
+    the request, so non-idempotent adds are only retried on 503. The
+    connectivity check is not retried at all, so that it fails within
+    PING_TIMEOUT while still using the shared connection pool.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == 'POST' and status_code in (502, 504):
+            return False
+        return super(_ApiRetry, self).is_retry(
+            method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        if (self.total != 0 and url is not None
+                and urlsplit(url).path.endswith(PING_ENDPOINT)):
+            return self.new(total=0).increment(method, url, *args, **kwargs)
+        return super(_ApiRetry, self).increment(method, url, *args, **kwargs)
+
+
+# Resolved SOLIDserver addresses: host -> (expiry, addresses or None on failure)
+_DNS_CACHE = {}
+# Hosts whose resolution is cached: host -> (ttl, error_ttl)
+_DNS_CACHE_HOSTS = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_create_connection = urllib3_connection.create_connection
+
+
+def _resolve_cached(host, port, ttl, error_ttl):
+    """Resolve `host` through the in-process DNS cache.
+
+    Returns:
+        Tuple of IP address strings, in getaddrinfo() order
+
+    Raises:
+        socket.gaierror: If the name does not resolve (failures are cached
+            for `error_ttl` seconds)
+    """
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        entry = _DNS_CACHE.get(host)
+    
+    if entry is not None and now < entry[0]:
+        if entry[1] is None:
+            raise socket.gaierror(
+                socket.EAI_NONAME, 'Cached resolution failure for %s' % host)
+        return entry[1]
+    
+    try:
+        infos = socket.getaddrinfo(host, port,
+                                   urllib3_connection.allowed_gai_family(),
+                                   socket.SOCK_STREAM)
+    except socket.gaierror:
+        with _DNS_CACHE_LOCK:
+            _DNS_CACHE[host] = (now + error_ttl, None)
+        raise
+    
+    # Keep every address (e.g. IPv6 and IPv4 of a dual-stack host) so that
+    # connecting can fall back to the next one like urllib3 itself does
+    addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[host] = (now + ttl, addresses)
+    
+    return addresses
+
+
+def _cached_create_connection(address, *args, **kwargs):
+    """urllib3 `create_connection` resolving registered hosts from cache.
+
+    Connections to hosts that were not registered with `_enable_dns_cache()`
+    are passed through to the original urllib3 implementation untouched.
+    """
+    host, port = address
+    settings = _DNS_CACHE_HOSTS.get(host)
+    if settings is None:
+        return _create_connection(address, *args, **kwargs)
+    
+    err = OSError('No address found for %s' % host)
+    for ip in _resolve_cached(host, port, *settings):
+        try:
+            return _create_connection((ip, port), *args, **kwargs)
+        except OSError as e:
+            err = e
+    
+    # The cached addresses may be stale, resolve again on next connect
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE.pop(host, None)
+    raise err
+
+
+def _enable_dns_cache(host, ttl, error_ttl):
+    """Cache the resolution of `host` for new urllib3 connections.
+
+    TLS still uses the host name for SNI and certificate checks; only the
+    getaddrinfo() lookup is skipped while the cached address is fresh.
+    """
+    if not host or ttl <= 0:
+        return
+    try:
+        ipaddress.ip_address(host)
+        return  # Nothing to resolve
+    except ValueError:
+        pass
+    
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE_HOSTS[host] = (ttl, error_ttl)
+        if urllib3_connection.create_connection is not _cached_create_connection:
+            urllib3_connection.create_connection = _cached_create_connection
+
+
+def _error_messages(body):
+    """Extract the `msg` strings of a SOLIDserver error body.
+
+    Returns:
+        List of message strings, or None if `body` is not a JSON API body
+    """
+    try:
+        result = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(result, dict) or not isinstance(
+            result.get('messages'), list):
+        return None
+    return [m.get('msg', '') for m in result['messages'] if isinstance(m, dict)]
+
+
+def _is_zone_not_found(messages):
+    """Check whether SOLIDserver reported the referenced zone as missing."""
+    return any(_ZONE_NOT_FOUND_RE.fullmatch(msg.strip()) for msg in messages)
+
+
+def _validate_rrset_type(recordset):
+    """Check that a recordset has a record type handled by this backend.
+
+    Done once per recordset so that individual records need no check.
+
+    Raises:
+        exceptions.BackendException: If record type is not A or AAAA
+    """
+    if recordset.type not in _SUPPORTED_TYPES:
+        LOG.error(_UNSUPPORTED_MSG, recordset.type)
+        raise exceptions.BackendException(_UNSUPPORTED_MSG % recordset.type)
+
 
 class SolidServerBackend(base.Backend):
     __plugin_name__ = 'solidserver'
 
+    # Sessions shared by all backend instances, keyed by
+    # (api_url, user, password, verify_ssl)
+    _shared_sessions = {}
+    _shared_sessions_lock = threading.Lock()
+
     def __init__(self, target):
         """Initialize the SOLIDserver backend.
 
@@ -82,15 +355,52 @@ class SolidServerBackend(base.Backend):
         self.verify_ssl = CONF.solidserver.verify_ssl
         # Default request timeout (seconds)
         self.timeout = CONF.solidserver.timeout
+        self.batch_api = CONF.solidserver.batch_api
+        self.max_workers = CONF.solidserver.max_workers
+        self.dns_cache_ttl = CONF.solidserver.dns_cache_ttl
+        self.dns_error_ttl = CONF.solidserver.dns_error_ttl
         
         # Build API base URL
         protocol = 'https' if self.ssl else 'http'
         self.api_url = f'{protocol}://{self.url}/api/v2.0'
+        self._urls = {ep: self.api_url + ep for ep in API_ENDPOINTS}
+
+        # Read-only templates of the fields that are constant for every zone
+        # and record payload; copied and extended per call. row_state=1
+        # enables the object.
+        self._zone_param_template = MappingProxyType({
+            'zone_type': 'master',
+            'zone_space': self.space,
+            'row_state': 1,
+        })
+        self._record_param_template = MappingProxyType({
+            'zone_space': self.space,
+            'row_state': 1,
+        })
 
         # Lazy session: do not create a requests.Session during import/instantiation
         # because that may cause side-effects in container startup. The session
         # will be created on first API call by `_ensure_session()`.
         self.session = None
+
+        # Worker pool for concurrent per-record API calls, created on first use
+        self._executor = None
+
+        # Whether batched RR requests are used; cleared once SOLIDserver
+        # reports that it does not implement them
+        self._batch_supported = bool(self.batch_api)
+        # Same for the optional RR patch endpoint used by update_recordset
+        self._patch_supported = True
+
+        # Zone IDs learned from create_zone/sync, used instead of zone names
+        self._zone_id_cache = cachetools.TTLCache(
+            maxsize=ZONE_ID_CACHE_SIZE,
+            ttl=ZONE_ID_CACHE_TTL
+        )
+        self._zone_id_lock = threading.Lock()
+
+        # Last ping result as (expiry timestamp, reachable)
+        self._ping_cache = (0.0, False)
         
         LOG.info(
             'Initialized SOLIDserver backend: url=%s, space=%s, ssl=%s',
@@ -99,7 +409,8 @@ class SolidServerBackend(base.Backend):
             self.ssl
         )
 
-    def _request(self, method, endpoint, data=None, params=None, timeout=None):
+    def _request(self, method, endpoint, data=None, params=None, timeout=None,
+                 unsupported_statuses=_UNSUPPORTED_STATUSES):
         """Make a request to the SOLIDserver API.
 
         Args:
@@ -107,6 +418,8 @@ class SolidServerBackend(base.Backend):
             endpoint: API endpoint path
             data: Request body data
             params: Query parameters
+            timeout: Request timeout overriding the configured one
+            unsupported_statuses: HTTP statuses raised as EndpointNotSupported
 
         Returns:
             Response JSON data
@@ -117,72 +430,264 @@ class SolidServerBackend(base.Backend):
         # Ensure HTTP session exists (lazy init)
         self._ensure_session()
 
-        url = urljoin(self.api_url, endpoint)
+        # api_url has no trailing slash and endpoints start with one
+        url = self._urls.get(endpoint) or (self.api_url + endpoint)
+        
+        # Serialize with orjson rather than letting requests use stdlib json;
+        # the session already sends the JSON Content-Type header
+        body = orjson.dumps(data) if data is not None else None
         
         try:
             req_timeout = timeout if timeout is not None else self.timeout
             response = self.session.request(
                 method,
                 url,
-                json=data,
+                data=body,
                 params=params,
                 timeout=req_timeout
             )
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # Check for API-level errors
-            if not result.get('success', False):
-                messages = result.get('messages', [])
-                error_msg = ', '.join([m.get('msg', '') for m in messages])
-                LOG.error(f'SOLIDserver API error: {error_msg}')
-                raise exceptions.BackendException(error_msg)
-            
-            return result
-            
         except requests.exceptions.RequestException as e:
-            LOG.error(f'SOLIDserver API request failed: {e}')
+            LOG.error('SOLIDserver API request failed: %s', e)
+            raise exceptions.BackendException(str(e))
+        
+        # Check the status directly instead of raising and catching HTTPError
+        if not response.ok:
+            error_msg = '%s: %s' % (response.status_code, response.text[:256])
+            LOG.error('SOLIDserver API request failed: %s', error_msg)
+            messages = _error_messages(response.content)
+            if _is_zone_not_found(messages or [response.text]):
+                raise ZoneNotFound(error_msg)
+            # Only a 404 without an API error body means the URL is unknown
+            if response.status_code in unsupported_statuses and (
+                    response.status_code != 404 or messages is None):
+                raise EndpointNotSupported(error_msg)
+            raise exceptions.BackendException(error_msg)
+        
+        # Empty bodies (e.g. 204 on DELETE) carry nothing to parse
+        if not response.content:
+            return {'success': True, 'data': []}
+        
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            LOG.error('Invalid JSON in SOLIDserver API response: %s', e)
             raise exceptions.BackendException(str(e))
+        
+        # Check for API-level errors
+        if not result.get('success', False):
+            messages = result.get('messages', [])
+            messages = [m.get('msg', '') for m in messages]
+            error_msg = ', '.join(messages)
+            LOG.error('SOLIDserver API error: %s', error_msg)
+            if _is_zone_not_found(messages):
+                raise ZoneNotFound(error_msg)
+            raise exceptions.BackendException(error_msg)
+        
+        return result
 
-    def _get_zone_params(self, zone):
-        """Extract zone parameters for SOLIDserver API.
+    def _zone_request(self, zname, method, endpoint, data=None, params=None,
+                      unsupported_statuses=_UNSUPPORTED_STATUSES):
+        """Make a zone-scoped request, retrying by zone name on a stale ID.
+
+        When the payload references the zone by its cached `zone_id` and
+        SOLIDserver reports the zone as not found, the cache entry is evicted
+        and the request is issued once more with the zone name and space.
+        Any other failure is raised as is: the request may already have been
+        applied, or would be rejected again.
 
         Args:
-            zone: Designate zone object
+            zname: Zone name without the trailing dot
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            unsupported_statuses: HTTP statuses raised as EndpointNotSupported
 
         Returns:
-            Dictionary of zone parameters
+            Response JSON data
+
+        Raises:
+            exceptions.BackendException: If API request fails
         """
+        try:
+            return self._request(method, endpoint, data=data, params=params,
+                                 unsupported_statuses=unsupported_statuses)
+        except ZoneNotFound:
+            payload = data if data is not None else params
+            if not payload or 'zone_id' not in payload:
+                raise
+            
+            LOG.debug('Retrying %s %s by name for zone %r', method, endpoint,
+                      zname)
+            self._evict_zone_id(zname)
+            
+            payload = dict(payload)
+            del payload['zone_id']
+            payload.update({
+                'zone_name': zname,
+                'zone_space': self.space,
+            })
+            if data is not None:
+                return self._request(method, endpoint, data=payload,
+                                     unsupported_statuses=unsupported_statuses)
+            return self._request(method, endpoint, params=payload,
+                                 unsupported_statuses=unsupported_statuses)
+
+    def _get_zone_ref(self, zname):
+        """Return the parameters identifying a zone in SOLIDserver API calls.
+
+        The cached zone ID is preferred so that SOLIDserver does not have to
+        resolve the zone by name on every record operation.
+
+        Args:
+            zname: Zone name without the trailing dot
+
+        Returns:
+            Dictionary with either `zone_id` or `zone_name` and `zone_space`
+        """
+        with self._zone_id_lock:
+            zone_id = self._zone_id_cache.get(zname)
+        
+        if zone_id is not None:
+            return {'zone_id': zone_id}
+        
         return {
-            'zone_name': zone.name.rstrip('.'),
-            'zone_type': 'master',
+            'zone_name': zname,
             'zone_space': self.space,
-            'row_state': 1,  # Enable the zone
         }
 
+    def _cache_zone_id(self, zname, zone_id):
+        """Remember the SOLIDserver ID of a zone."""
+        if zone_id is None:
+            return
+        with self._zone_id_lock:
+            self._zone_id_cache[zname] = zone_id
+
+    def _evict_zone_id(self, zname):
+        """Forget the cached SOLIDserver ID of a zone."""
+        with self._zone_id_lock:
+            self._zone_id_cache.pop(zname, None)
+
+    def _get_zone_params(self, zname):
+        """Extract zone parameters for SOLIDserver API.
+
+        Args:
+            zname: Zone name without the trailing dot
+
+        Returns:
+            Dictionary of zone parameters
+        """
+        params = dict(self._zone_param_template)
+        params['zone_name'] = zname
+        
+        return params
+
     def _ensure_session(self):
-        """Create and configure the requests.Session if not already present.
+        """Attach the shared requests.Session if not already present.
 
         This is intentionally lazy to avoid performing network-related setup
         during module import or backend instantiation which can delay or
         block service startup.
+
+        Backends talking to the same SOLIDserver with the same credentials
+        share one session, and therefore one pool of keep-alive connections.
         """
         if self.session is None:
-            sess = requests.Session()
-            sess.auth = HTTPBasicAuth(self.user, self.password)
-            sess.verify = self.verify_ssl
-            sess.headers.update({
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            })
+            key = (self.api_url, self.user, self.password, self.verify_ssl)
+            with self._shared_sessions_lock:
+                sess = self._shared_sessions.get(key)
+                if sess is None:
+                    sess = self._build_session()
+                    self._shared_sessions[key] = sess
             self.session = sess
 
-    def _get_record_params(self, zone, recordset, record):
+    def _build_session(self):
+        """Create and configure a requests.Session for the SOLIDserver API.
+
+        Returns:
+            Configured requests.Session
+        """
+        sess = requests.Session()
+        # Encode the Basic credentials once instead of letting HTTPBasicAuth
+        # re-encode them on every prepared request
+        sess.auth = _PreEncodedBasicAuth(self.user, self.password)
+        sess.verify = self.verify_ssl
+        sess.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        # Keep connections alive across the bursts of calls triggered by
+        # recordset updates and retry transient gateway errors. Read errors
+        # are not retried: the request may already have been applied.
+        pool_size = max(HTTP_POOL_SIZE, self.max_workers)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=_ApiRetry(
+                total=3,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST', 'DELETE', 'PUT']),
+                raise_on_status=False,
+            )
+        )
+        sess.mount('https://', adapter)
+        sess.mount('http://', adapter)
+        # Resolve the SOLIDserver host once per TTL instead of per connect
+        _enable_dns_cache(
+            urlsplit(self.api_url).hostname,
+            self.dns_cache_ttl,
+            self.dns_error_ttl
+        )
+        
+        return sess
+
+    def _map_records(self, func, records):
+        """Apply `func` to every record, issuing the API calls concurrently.
+
+        Record operations are independent of each other, so their network
+        round trips are overlapped on a small thread pool instead of being
+        serialized. Single-record recordsets are handled inline.
+
+        Args:
+            func: Callable taking a single record
+            records: Iterable of Designate record objects
+
+        All calls are waited for, even when one of them fails, so that no
+        record operation is still in flight when the caller sees the error.
+
+        Raises:
+            exceptions.BackendException: First error raised by `func`, in
+                record order
+        """
+        records = list(records)
+        if len(records) <= 1:
+            for record in records:
+                func(record)
+            return
+
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self.max_workers
+            )
+
+        pending = [self._executor.submit(func, record) for record in records]
+        futures.wait(pending)
+        
+        errors = [f.exception() for f in pending if f.exception() is not None]
+        if errors:
+            if len(errors) > 1:
+                LOG.error('%d of %d record operations failed',
+                          len(errors), len(records))
+            raise errors[0]
+
+    def _get_record_params(self, zname, recordset, record):
         """Extract record parameters for SOLIDserver API.
 
         Args:
-            zone: Designate zone object
+            zname: Zone name without the trailing dot
             recordset: Designate recordset object
             record: Designate record object
 
@@ -195,41 +700,115 @@ class SolidServerBackend(base.Backend):
         # Build the record value based on type
         rr_value = self._build_rr_value(recordset, record)
         
-        params = {
-            'zone_name': zone.name.rstrip('.'),
-            'zone_space': self.space,
+        params = dict(self._record_param_template)
+        params.update(self._get_zone_ref(zname))
+        params.update({
             'rr_name': recordset.name.rstrip('.'),
             'rr_type': rr_type,
             'rr_value': rr_value,
             'rr_ttl': recordset.ttl,
-            'row_state': 1,
-        }
+        })
         
         return params
 
+    def _disable_batch(self):
+        """Stop using batched RR requests after SOLIDserver rejected one."""
+        LOG.warning(
+            'SOLIDserver does not implement batched RR requests, handling '
+            'records one by one'
+        )
+        self._batch_supported = False
+
+    def _get_rr_entries(self, recordset, records):
+        """Build the RR entries of a batch payload.
+
+        Args:
+            recordset: Designate recordset object the records belong to
+            records: Designate record objects
+
+        Returns:
+            List of RR entry dictionaries
+        """
+        rr_name = recordset.name.rstrip('.')
+        
+        return [
+            {
+                'rr_name': rr_name,
+                'rr_type': recordset.type,
+                'rr_value': self._build_rr_value(recordset, record),
+                'rr_ttl': recordset.ttl,
+            }
+            for record in records
+        ]
+
+    def _get_rr_delete_entries(self, recordset, records):
+        """Build the entries identifying RRs to delete.
+
+        The same keys are used for the batched delete body and for the query
+        parameters of a single record delete.
+
+        Args:
+            recordset: Designate recordset object the records belong to
+            records: Designate record objects
+
+        Returns:
+            List of RR identity dictionaries
+        """
+        rr_name = recordset.name.rstrip('.')
+        
+        return [
+            {
+                'rr_name': rr_name,
+                'rr_type': recordset.type,
+                'rr_value': self._build_rr_value(recordset, record),
+            }
+            for record in records
+        ]
+
+    @staticmethod
+    def _diff_records(existing, desired):
+        """Compute the records to add and remove to go from existing to desired.
+
+        A TTL change replaces every record, since the TTL is stored on each RR.
+
+        Args:
+            existing: Designate recordset currently on SOLIDserver
+            desired: Designate recordset to converge to
+
+        Returns:
+            Dictionary with `adds` (records of `desired`) and `removes`
+            (records of `existing`)
+        """
+        if existing.ttl != desired.ttl:
+            return {
+                'adds': list(desired.records),
+                'removes': list(existing.records),
+            }
+        
+        existing_data = {record.data for record in existing.records}
+        desired_data = {record.data for record in desired.records}
+        
+        return {
+            'adds': [record for record in desired.records
+                     if record.data not in existing_data],
+            'removes': [record for record in existing.records
+                        if record.data not in desired_data],
+        }
+
     def _build_rr_value(self, recordset, record):
         """Build RR value string for SOLIDserver API based on record type.
 
+        The record type is validated once per recordset by
+        `_validate_rrset_type()`; A and AAAA values are sent as is.
+
         Args:
             recordset: Designate recordset object
             record: Designate record object
 
         Returns:
             String representation of the record value
-
-        Raises:
-            exceptions.BackendException: If record type is not A or AAAA
         """
-        rr_type = recordset.type
-        data = record.data
-        
-        # Only support A (IPv4) and AAAA (IPv6) record types
-        if rr_type in ('A', 'AAAA'):
-            return data
-        else:
-            error_msg = f'Unsupported record type: {rr_type}. Only A and AAAA records are supported.'
-            LOG.error(error_msg)
-            raise exceptions.BackendException(error_msg)
+        return record.data
 
     def create_zone(self, context, zone):
         """Create a DNS zone.
@@ -243,19 +822,21 @@ class SolidServerBackend(base.Backend):
         """
         LOG.info('Creating zone %r', zone.name)
         
-        zone_params = self._get_zone_params(zone)
+        zname = zone.name.rstrip('.')
+        zone_params = self._get_zone_params(zname)
         
         try:
             result = self._request('POST', '/dns/zone/add', data=zone_params)
             
             if result.get('data'):
                 zone_id = result['data'][0].get('zone_id')
-                LOG.info(f'Zone {zone.name} created with ID {zone_id}')
+                self._cache_zone_id(zname, zone_id)
+                LOG.info('Zone %s created with ID %s', zone.name, zone_id)
             else:
                 raise exceptions.BackendException('No zone ID returned from API')
                 
         except exceptions.BackendException as e:
-            LOG.error(f'Failed to create zone {zone.name}: {e}')
+            LOG.error('Failed to create zone %s: %s', zone.name, e)
             raise
 
     def delete_zone(self, context, zone):
@@ -270,17 +851,19 @@ class SolidServerBackend(base.Backend):
         """
         LOG.info('Deleting zone %r', zone.name)
         
+        zname = zone.name.rstrip('.')
         delete_params = {
-            'zone_name': zone.name.rstrip('.'),
+            'zone_name': zname,
             'zone_space': self.space,
         }
         
         try:
             self._request('DELETE', '/dns/zone/delete', params=delete_params)
-            LOG.info(f'Zone {zone.name} deleted')
+            self._evict_zone_id(zname)
+            LOG.info('Zone %s deleted', zone.name)
             
         except exceptions.BackendException as e:
-            LOG.error(f'Failed to delete zone {zone.name}: {e}')
+            LOG.error('Failed to delete zone %s: %s', zone.name, e)
             raise
 
     def create_recordset(self, context, zone, recordset):
@@ -294,17 +877,53 @@ class SolidServerBackend(base.Backend):
         Raises:
             exceptions.BackendException: If recordset creation fails or record type is not A/AAAA
         """
-        # Validate record type
-        if recordset.type not in ('A', 'AAAA'):
-            error_msg = f'Unsupported record type: {recordset.type}. Only A and AAAA records are supported.'
-            LOG.error(error_msg)
-            raise exceptions.BackendException(error_msg)
+        _validate_rrset_type(recordset)
         
         LOG.info('Creating recordset %r in zone %r', recordset.name, zone.name)
         
-        # Create each record in the recordset
-        for record in recordset.records:
-            self.create_record(context, zone, recordset, record)
+        if not recordset.records:
+            return
+        
+        zname = zone.name.rstrip('.')
+        
+        if self._batch_supported:
+            batch_params = dict(self._record_param_template)
+            batch_params.update(self._get_zone_ref(zname))
+            batch_params['rr_entries'] = self._get_rr_entries(
+                recordset, recordset.records)
+            
+            try:
+                result = self._zone_request(
+                    zname, 'POST', '/dns/rr/add', data=batch_params)
+                
+                if not result.get('data'):
+                    raise exceptions.BackendException(
+                        'No RR ID returned from API')
+                LOG.info(
+                    'Recordset %s %s created with %d record(s)',
+                    recordset.name,
+                    recordset.type,
+                    len(result['data'])
+                )
+                return
+                
+            except EndpointNotSupported:
+                self._disable_batch()
+            except exceptions.BackendException as e:
+                LOG.error(
+                    'Failed to create recordset %s %s: %s',
+                    recordset.name,
+                    recordset.type,
+                    e
+                )
+                raise
+        
+        # Create the records of the recordset concurrently
+        self._map_records(
+            lambda record: self.create_record(
+                context, zone, recordset, record),
+            recordset.records
+        )
 
     def create_record(self, context, zone, recordset, record):
         """Create a single DNS record.
@@ -325,22 +944,30 @@ class SolidServerBackend(base.Backend):
             zone.name
         )
         
-        record_params = self._get_record_params(zone, recordset, record)
+        zname = zone.name.rstrip('.')
+        record_params = self._get_record_params(zname, recordset, record)
         
         try:
-            result = self._request('POST', '/dns/rr/add', data=record_params)
+            result = self._zone_request(
+                zname, 'POST', '/dns/rr/add', data=record_params)
             
             if result.get('data'):
                 rr_id = result['data'][0].get('rr_id')
                 LOG.info(
-                    f'Record {recordset.name} {recordset.type} created with ID {rr_id}'
+                    'Record %s %s created with ID %s',
+                    recordset.name,
+                    recordset.type,
+                    rr_id
                 )
             else:
                 raise exceptions.BackendException('No RR ID returned from API')
                 
         except exceptions.BackendException as e:
             LOG.error(
-                f'Failed to create record {recordset.name} {recordset.type}: {e}'
+                'Failed to create record %s %s: %s',
+                recordset.name,
+                recordset.type,
+                e
             )
             raise
 
@@ -355,11 +982,47 @@ class SolidServerBackend(base.Backend):
         Raises:
             exceptions.BackendException: If recordset deletion fails or record type is not A/AAAA
         """
+        _validate_rrset_type(recordset)
+        
         LOG.info('Deleting recordset %r in zone %r', recordset.name, zone.name)
         
-        # Delete each record in the recordset
-        for record in recordset.records:
-            self.delete_record(context, zone, recordset, record)
+        if not recordset.records:
+            return
+        
+        zname = zone.name.rstrip('.')
+        
+        if self._batch_supported:
+            batch_params = self._get_zone_ref(zname)
+            batch_params['rr_entries'] = self._get_rr_delete_entries(
+                recordset, recordset.records)
+            
+            try:
+                self._zone_request(
+                    zname, 'DELETE', '/dns/rr/delete', data=batch_params)
+                LOG.info(
+                    'Recordset %s %s deleted',
+                    recordset.name,
+                    recordset.type
+                )
+                return
+                
+            except EndpointNotSupported:
+                self._disable_batch()
+            except exceptions.BackendException as e:
+                LOG.error(
+                    'Failed to delete recordset %s %s: %s',
+                    recordset.name,
+                    recordset.type,
+                    e
+                )
+                raise
+        
+        # Delete the records of the recordset concurrently
+        self._map_records(
+            lambda record: self.delete_record(
+                context, zone, recordset, record),
+            recordset.records
+        )
 
     def delete_record(self, context, zone, recordset, record):
         """Delete a single DNS record.
@@ -380,22 +1043,26 @@ class SolidServerBackend(base.Backend):
             zone.name
         )
         
-        delete_params = {
-            'zone_name': zone.name.rstrip('.'),
-            'zone_space': self.space,
-            'rr_name': recordset.name.rstrip('.'),
-            'rr_type': recordset.type,
-        }
+        zname = zone.name.rstrip('.')
+        delete_params = self._get_zone_ref(zname)
+        delete_params.update(
+            self._get_rr_delete_entries(recordset, [record])[0])
         
         try:
-            self._request('DELETE', '/dns/rr/delete', params=delete_params)
+            self._zone_request(
+                zname, 'DELETE', '/dns/rr/delete', params=delete_params)
             LOG.info(
-                f'Record {recordset.name} {recordset.type} deleted'
+                'Record %s %s deleted',
+                recordset.name,
+                recordset.type
             )
             
         except exceptions.BackendException as e:
             LOG.error(
-                f'Failed to delete record {recordset.name} {recordset.type}: {e}'
+                'Failed to delete record %s %s: %s',
+                recordset.name,
+                recordset.type,
+                e
             )
             raise
 
@@ -411,18 +1078,88 @@ class SolidServerBackend(base.Backend):
             changes: Tuple of (desired, existing) recordset objects
 
         Raises:
-            exceptions.BackendException: If recordset update fails
+            exceptions.BackendException: If recordset update fails or record type is not A/AAAA
         """
         desired, existing = changes
         
+        _validate_rrset_type(desired or existing)
+        
         LOG.info('Updating recordset %r in zone %r', desired.name, zone.name)
         
-        # Delete old records and create new ones
-        if existing:
-            self.delete_recordset(context, zone, existing)
+        if not existing or not desired:
+            if existing:
+                self.delete_recordset(context, zone, existing)
+            if desired:
+                self.create_recordset(context, zone, desired)
+            return
         
-        if desired:
+        diff = self._diff_records(existing, desired)
+        if not diff['adds'] and not diff['removes']:
+            LOG.debug('Recordset %r is unchanged', desired.name)
+            return
+        
+        if self._batch_supported and self._patch_supported:
+            # Apply additions and removals atomically in a single call so the
+            # name never resolves to an empty RRset during the update
+            zname = zone.name.rstrip('.')
+            patch_params = dict(self._record_param_template)
+            patch_params.update(self._get_zone_ref(zname))
+            patch_params['adds'] = self._get_rr_entries(desired, diff['adds'])
+            patch_params['removes'] = self._get_rr_delete_entries(
+                existing, diff['removes'])
+            
+            try:
+                self._zone_request(
+                    zname, 'POST', '/dns/rr/patch', data=patch_params,
+                    unsupported_statuses=_PATCH_UNSUPPORTED_STATUSES)
+                LOG.info(
+                    'Recordset %s %s updated: %d added, %d removed',
+                    desired.name,
+                    desired.type,
+                    len(diff['adds']),
+                    len(diff['removes'])
+                )
+                return
+                
+            except EndpointNotSupported:
+                LOG.warning(
+                    'SOLIDserver does not implement RR patch, applying '
+                    'recordset changes record by record'
+                )
+                self._patch_supported = False
+            except exceptions.BackendException as e:
+                LOG.error(
+                    'Failed to update recordset %s %s: %s',
+                    desired.name,
+                    desired.type,
+                    e
+                )
+                raise
+        
+        if existing.ttl != desired.ttl:
+            # Every record changes: delete old records and create new ones
+            self.delete_recordset(context, zone, existing)
             self.create_recordset(context, zone, desired)
+            return
+        
+        # Add before removing so the name never resolves to an empty RRset
+        self._map_records(
+            lambda record: self.create_record(
+                context, zone, desired, record),
+            diff['adds']
+        )
+        self._map_records(
+            lambda record: self.delete_record(
+                context, zone, existing, record),
+            diff['removes']
+        )
+        LOG.info(
+            'Recordset %s %s updated: %d added, %d removed',
+            desired.name,
+            desired.type,
+            len(diff['adds']),
+            len(diff['removes'])
+        )
 
     def update_record(self, context, zone, recordset, record, changes):
         """Update a single record.
@@ -437,10 +1174,12 @@ class SolidServerBackend(base.Backend):
             changes: Tuple of (desired, existing) record objects
 
         Raises:
-            exceptions.BackendException: If record update fails
+            exceptions.BackendException: If record update fails or record type is not A/AAAA
         """
         desired, existing = changes
         
+        _validate_rrset_type(recordset)
+        
         LOG.info(
             'Updating record %s %s in zone %r',
             recordset.name,
@@ -468,40 +1207,80 @@ class SolidServerBackend(base.Backend):
         """
         LOG.info('Syncing zone %r with SOLIDserver', zone.name)
         
-        # Fetch the zone from SOLIDserver
+        zname = zone.name.rstrip('.')
+        
+        # Fetch only the fields we need from the first matching zone. Single
+        # quotes are doubled so that names cannot break the where clause.
         try:
             params = {
-                'where': f'zone_name=\'{zone.name.rstrip(".")}\'',
+                'where': "zone_name='%s'" % zname.replace("'", "''"),
                 'zone_space': self.space,
+                'limit': 1,
+                'TAGS': 'zone_id,zone_name,zone_space_name',
             }
             
             result = self._request('GET', '/dns/zone/list', params=params)
             
             if result.get('data'):
                 zone_data = result['data'][0]
-                LOG.info(f'Zone {zone.name} synced from SOLIDserver')
-                LOG.debug(f'Zone data: {zone_data}')
+                # Only trust the zone ID if the filters were actually
+                # applied, otherwise record calls would target another zone
+                found = (zone_data.get('zone_name') or '').rstrip('.')
+                space = zone_data.get('zone_space_name')
+                if found.lower() != zname.lower() or space != self.space:
+                    LOG.warning(
+                        'SOLIDserver returned zone %r in space %r when '
+                        'looking up %s, not caching its ID',
+                        found, space, zone.name
+                    )
+                    return
+                
+                self._cache_zone_id(zname, zone_data.get('zone_id'))
+                LOG.info('Zone %s synced from SOLIDserver', zone.name)
+                LOG.debug('Zone data: %s', zone_data)
             else:
-                LOG.warning(f'Zone {zone.name} not found on SOLIDserver')
+                LOG.warning('Zone %s not found on SOLIDserver', zone.name)
                 
         except exceptions.BackendException as e:
-            LOG.error(f'Failed to sync zone {zone.name}: {e}')
+            LOG.error('Failed to sync zone %s: %s', zone.name, e)
 
     def ping(self, context):
         """Ping the SOLIDserver API to verify connectivity.
 
+        A successful result is reused for PING_CACHE_TTL seconds and a
+        failure for PING_ERROR_TTL seconds before the API is queried again.
+
         Args:
             context: Designate context
 
+        Returns:
+            True if API is reachable, False otherwise
+        """
+        now = time.monotonic()
+        expires, reachable = self._ping_cache
+        if now < expires:
+            return reachable
+        
+        reachable = self._ping()
+        ttl = PING_CACHE_TTL if reachable else PING_ERROR_TTL
+        self._ping_cache = (now + ttl, reachable)
+        
+        return reachable
+
+    def _ping(self):
+        """Check API connectivity with a live request.
+
         Returns:
             True if API is reachable, False otherwise
         """
         LOG.debug('Pinging SOLIDserver API')
         
         try:
-            # Try to list zones (minimal operation) with short timeout to avoid
-            # blocking service startup when SOLIDserver is unreachable.
-            result = self._request('GET', '/dns/zone/count', timeout=5)
+            # Count zones (minimal operation). The request goes through a
+            # keep-alive connection of the shared session, so repeated pings
+            # do not pay for a new TCP/TLS handshake.
+            result = self._request('GET', PING_ENDPOINT,
+                                   timeout=PING_TIMEOUT)
             
             if result.get('success'):
                 LOG.debug('SOLIDserver API is reachable')
@@ -511,5 +1290,5 @@ class SolidServerBackend(base.Backend):
                 return False
                 
         except exceptions.BackendException as e:
-            LOG.error(f'Failed to ping SOLIDserver API: {e}')
+            LOG.error('Failed to ping SOLIDserver API: %s', e)
             return False
@@ -2,13 +2,21 @@
 Unit tests for SOLIDserver Designate backend
 """
 
+from concurrent import futures
+import socket
+import time
 import unittest
 from unittest import mock
 
+import orjson
+import requests
+import urllib3
+
 from designate import exceptions
 from designate.tests import TestCase
 from designate import objects
 
+import solidserver_backend
 from solidserver_backend import SolidServerBackend
 
 
@@ -29,12 +37,29 @@ class SolidServerBackendTestCase(TestCase):
             'solidserver_dns_view': 'default',
             'solidserver_verify_ssl': False,
         }
+        
+        # Concrete [solidserver] values: they end up in JSON request bodies,
+        # which cannot serialize MagicMock attributes
+        self.solidserver_opts = {
+            'url': 'sds.example.com',
+            'space': 'local',
+            'user': 'admin',
+            'password': 'admin',
+            'ssl': True,
+            'verify_ssl': False,
+            'timeout': 5,
+            'batch_api': False,
+            'max_workers': 8,
+            'dns_cache_ttl': 0,
+            'dns_error_ttl': 0.15,
+        }
 
     @mock.patch('solidserver_backend.CONF')
     @mock.patch('solidserver_backend.requests.Session')
     def test_init(self, mock_session, mock_conf):
         """Test backend initialization"""
         mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+        mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
         
         backend = SolidServerBackend(None)
         
@@ -50,16 +75,17 @@ class SolidServerBackendTestCase(TestCase):
         mock_session_class.return_value = mock_session
         
         mock_response = mock.MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             'success': True,
             'data': [{'zone_id': '123'}],
             'messages': []
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_session.request.return_value = mock_response
         
         with mock.patch('solidserver_backend.CONF') as mock_conf:
             mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
             
             backend = SolidServerBackend(None)
             backend.session = mock_session
@@ -80,6 +106,135 @@ class SolidServerBackendTestCase(TestCase):
             self.assertEqual(call_args[0][0], 'POST')
             self.assertIn('/dns/zone/add', call_args[0][1])
 
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_create_zone_caches_zone_id(self, mock_session_class):
+        """Test record operations reuse the zone ID returned on creation"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'zone_id': '123', 'rr_id': '456'}],
+            'messages': []
+        })
+        mock_response.raise_for_status.return_value = None
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(name='www.example.com.', type='A')
+            record = objects.Record(data='192.0.2.1')
+            
+            backend.create_zone(None, zone)
+            backend.create_record(None, zone, recordset, record)
+            
+            payload = orjson.loads(mock_session.request.call_args[1]['data'])
+            self.assertEqual(payload['zone_id'], '123')
+            self.assertNotIn('zone_name', payload)
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_stale_zone_id_retried_by_name(self, mock_session_class):
+        """Test a zone-not-found error on a cached ID retries by zone name"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        not_found = mock.MagicMock()
+        not_found.content = orjson.dumps({
+            'success': False,
+            'messages': [{'msg': 'Zone not found'}]
+        })
+        created = mock.MagicMock()
+        created.content = orjson.dumps({
+            'success': True,
+            'data': [{'rr_id': '456'}],
+            'messages': []
+        })
+        mock_session.request.side_effect = [not_found, created]
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            backend._cache_zone_id('example.com', '123')
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(name='www.example.com.', type='A')
+            record = objects.Record(data='192.0.2.1')
+            
+            backend.create_record(None, zone, recordset, record)
+            
+            self.assertEqual(mock_session.request.call_count, 2)
+            first, second = mock_session.request.call_args_list
+            self.assertEqual(orjson.loads(first[1]['data'])['zone_id'], '123')
+            payload = orjson.loads(second[1]['data'])
+            self.assertNotIn('zone_id', payload)
+            self.assertEqual(payload['zone_name'], 'example.com')
+            self.assertEqual(backend._get_zone_ref('example.com'), {
+                'zone_name': 'example.com',
+                'zone_space': backend.space,
+            })
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_cached_zone_id_not_retried_on_other_errors(self,
+                                                        mock_session_class):
+        """Test errors other than zone-not-found are not retried by name"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            backend._cache_zone_id('example.com', '123')
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(name='www.example.com.', type='A')
+            record = objects.Record(data='192.0.2.1')
+            
+            # Record-level errors mentioning the zone must not evict it
+            for msg in ('RR already exists',
+                        'zone_id 123: record does not exist',
+                        'zone example.com: rr_value unknown'):
+                mock_session.request.reset_mock()
+                mock_response.content = orjson.dumps({
+                    'success': False,
+                    'messages': [{'msg': msg}]
+                })
+                
+                self.assertRaises(
+                    exceptions.BackendException,
+                    backend.create_record, None, zone, recordset, record
+                )
+                mock_session.request.assert_called_once()
+                self.assertEqual(backend._get_zone_ref('example.com'),
+                                 {'zone_id': '123'})
+
     @mock.patch('solidserver_backend.requests.Session')
     def test_delete_zone(self, mock_session_class):
         """Test zone deletion"""
@@ -87,16 +242,17 @@ class SolidServerBackendTestCase(TestCase):
         mock_session_class.return_value = mock_session
         
         mock_response = mock.MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             'success': True,
             'data': [{'zone_id': '123'}],
             'messages': []
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_session.request.return_value = mock_response
         
         with mock.patch('solidserver_backend.CONF') as mock_conf:
             mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
             
             backend = SolidServerBackend(None)
             backend.session = mock_session
@@ -121,16 +277,17 @@ class SolidServerBackendTestCase(TestCase):
         mock_session_class.return_value = mock_session
         
         mock_response = mock.MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             'success': True,
             'data': [{'count': 5}],
             'messages': []
-        }
+        })
         mock_response.raise_for_status.return_value = None
         mock_session.request.return_value = mock_response
         
         with mock.patch('solidserver_backend.CONF') as mock_conf:
             mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
             
             backend = SolidServerBackend(None)
             backend.session = mock_session
@@ -139,6 +296,33 @@ class SolidServerBackendTestCase(TestCase):
             
             self.assertTrue(result)
 
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_ping_cached(self, mock_session_class):
+        """Test successive pings reuse the cached result"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'count': 5}],
+            'messages': []
+        })
+        mock_response.raise_for_status.return_value = None
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            self.assertTrue(backend.ping(None))
+            self.assertTrue(backend.ping(None))
+            
+            mock_session.request.assert_called_once()
+
     @mock.patch('solidserver_backend.requests.Session')
     def test_ping_failure(self, mock_session_class):
         """Test failed ping"""
@@ -149,6 +333,7 @@ class SolidServerBackendTestCase(TestCase):
         
         with mock.patch('solidserver_backend.CONF') as mock_conf:
             mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
             
             backend = SolidServerBackend(None)
             backend.session = mock_session
@@ -157,10 +342,609 @@ class SolidServerBackendTestCase(TestCase):
             
             self.assertFalse(result)
 
+    def test_session_retry_policy(self):
+        """Test possibly applied requests and pings are not retried"""
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            
+            session = backend._build_session()
+            
+            retry = session.get_adapter(
+                backend._urls['/dns/rr/add']).max_retries
+            self.assertEqual(retry.read, 0)
+            self.assertFalse(retry.is_retry('POST', 502))
+            self.assertFalse(retry.is_retry('POST', 504))
+            self.assertTrue(retry.is_retry('POST', 503))
+            self.assertTrue(retry.is_retry('GET', 502))
+            
+            # Pings share the pool, but a failed one is never retried
+            ping_url = backend._urls['/dns/zone/count']
+            self.assertIs(session.get_adapter(ping_url).max_retries, retry)
+            error = urllib3.exceptions.ConnectTimeoutError('timed out')
+            self.assertRaises(
+                urllib3.exceptions.MaxRetryError,
+                retry.increment, 'GET', ping_url, error=error
+            )
+            self.assertEqual(
+                retry.increment('GET', backend._urls['/dns/zone/list'],
+                                error=error).total,
+                2
+            )
+
+    def test_session_auth(self):
+        """Test the session sends the configured Basic credentials"""
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.user = 'admin'
+            backend.password = 'secret'
+            
+            session = backend._build_session()
+            
+            self.assertIsNotNone(session.auth)
+            self.assertNotIn('Authorization', session.headers)
+            request = session.prepare_request(
+                requests.Request('GET', 'https://sds.example.com/'))
+            self.assertEqual(
+                request.headers['Authorization'],
+                requests.auth._basic_auth_str('admin', 'secret')
+            )
+
+    @mock.patch.dict(SolidServerBackend._shared_sessions, clear=True)
+    def test_shared_session_per_credentials(self):
+        """Test backends only share a session when their credentials match"""
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backends = [SolidServerBackend(None) for _ in range(3)]
+            for backend, password in zip(backends, ('one', 'one', 'two')):
+                backend.password = password
+                backend._ensure_session()
+            
+            self.assertIs(backends[0].session, backends[1].session)
+            self.assertIsNot(backends[0].session, backends[2].session)
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_create_recordset(self, mock_session_class):
+        """Test recordset creation issues a single batched request"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'rr_id': '456'}],
+            'messages': []
+        })
+        mock_response.raise_for_status.return_value = None
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(
+                **dict(self.solidserver_opts, batch_api=True))
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.1'),
+                    objects.Record(data='192.0.2.2'),
+                    objects.Record(data='192.0.2.3'),
+                ]),
+            )
+            
+            backend.create_recordset(None, zone, recordset)
+            
+            mock_session.request.assert_called_once()
+            call_args = mock_session.request.call_args
+            self.assertEqual(call_args[0][0], 'POST')
+            self.assertIn('/dns/rr/add', call_args[0][1])
+            self.assertEqual(
+                [rr['rr_value']
+                 for rr in orjson.loads(call_args[1]['data'])['rr_entries']],
+                ['192.0.2.1', '192.0.2.2', '192.0.2.3']
+            )
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_create_recordset_per_record(self, mock_session_class):
+        """Test recordset creation sends one request per record by default"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'rr_id': '456'}],
+            'messages': []
+        })
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.1'),
+                    objects.Record(data='192.0.2.2'),
+                ]),
+            )
+            
+            backend.create_recordset(None, zone, recordset)
+            
+            self.assertEqual(mock_session.request.call_count, 2)
+            payloads = [orjson.loads(call[1]['data'])
+                        for call in mock_session.request.call_args_list]
+            self.assertEqual(sorted(p['rr_value'] for p in payloads),
+                             ['192.0.2.1', '192.0.2.2'])
+            self.assertTrue(all('rr_entries' not in p for p in payloads))
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_create_recordset_batch_not_supported(self, mock_session_class):
+        """Test an unsupported batch request falls back to per-record calls"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        unsupported_response = mock.MagicMock()
+        unsupported_response.ok = False
+        unsupported_response.status_code = 405
+        unsupported_response.text = 'Method Not Allowed'
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'rr_id': '456'}],
+            'messages': []
+        })
+        mock_session.request.side_effect = [unsupported_response] + [
+            mock_response] * 5
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(
+                **dict(self.solidserver_opts, batch_api=True))
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            backend.max_workers = 2
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.1'),
+                    objects.Record(data='192.0.2.2'),
+                ]),
+            )
+            
+            with mock.patch.object(backend, '_map_records',
+                                   wraps=backend._map_records) as map_records:
+                backend.create_recordset(None, zone, recordset)
+                
+                map_records.assert_called_once()
+            
+            self.assertFalse(backend._batch_supported)
+            self.assertEqual(mock_session.request.call_count, 3)
+            values = sorted(
+                orjson.loads(call[1]['data'])['rr_value']
+                for call in mock_session.request.call_args_list[1:]
+            )
+            self.assertEqual(values, ['192.0.2.1', '192.0.2.2'])
+            
+            # Later recordsets skip the batch request altogether
+            backend.create_recordset(None, zone, recordset)
+            
+            self.assertEqual(mock_session.request.call_count, 5)
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_update_recordset(self, mock_session_class):
+        """Test recordset update sends only the changed records in one call"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [],
+            'messages': []
+        })
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(
+                **dict(self.solidserver_opts, batch_api=True))
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            existing = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.1'),
+                    objects.Record(data='192.0.2.2'),
+                ]),
+            )
+            desired = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.2'),
+                    objects.Record(data='192.0.2.3'),
+                ]),
+            )
+            
+            backend.update_recordset(None, zone, desired, (desired, existing))
+            
+            mock_session.request.assert_called_once()
+            call_args = mock_session.request.call_args
+            self.assertEqual(call_args[0][0], 'POST')
+            self.assertIn('/dns/rr/patch', call_args[0][1])
+            payload = orjson.loads(call_args[1]['data'])
+            self.assertEqual(
+                [rr['rr_value'] for rr in payload['adds']], ['192.0.2.3'])
+            self.assertEqual(
+                [rr['rr_value'] for rr in payload['removes']], ['192.0.2.1'])
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_update_recordset_patch_not_found(self, mock_session_class):
+        """Test a missing patch endpoint falls back to per-record changes"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        not_found_response = mock.MagicMock()
+        not_found_response.ok = False
+        not_found_response.status_code = 404
+        not_found_response.content = b'Not Found'
+        not_found_response.text = 'Not Found'
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'rr_id': '456'}],
+            'messages': []
+        })
+        mock_session.request.side_effect = [not_found_response] + [
+            mock_response] * 4
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(
+                **dict(self.solidserver_opts, batch_api=True))
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            existing = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.1'),
+                    objects.Record(data='192.0.2.2'),
+                ]),
+            )
+            desired = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.2'),
+                    objects.Record(data='192.0.2.3'),
+                ]),
+            )
+            
+            backend.update_recordset(None, zone, desired, (desired, existing))
+            
+            self.assertFalse(backend._patch_supported)
+            calls = mock_session.request.call_args_list
+            self.assertEqual(
+                [(call[0][0], call[0][1].rsplit('/api/v2.0', 1)[1])
+                 for call in calls],
+                [('POST', '/dns/rr/patch'),
+                 ('POST', '/dns/rr/add'),
+                 ('DELETE', '/dns/rr/delete')]
+            )
+            # Only the changed records are sent, the new one first
+            self.assertEqual(
+                orjson.loads(calls[1][1]['data'])['rr_value'], '192.0.2.3')
+            self.assertEqual(calls[2][1]['params']['rr_value'], '192.0.2.1')
+            
+            # Later updates skip the patch request altogether
+            backend.update_recordset(None, zone, existing, (existing, desired))
+            
+            self.assertEqual(mock_session.request.call_count, 5)
+            self.assertNotIn(
+                '/dns/rr/patch', mock_session.request.call_args[0][1])
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_update_recordset_patch_api_error(self, mock_session_class):
+        """Test a 404 API error from the patch endpoint is not a fallback"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.ok = False
+        mock_response.status_code = 404
+        mock_response.content = orjson.dumps({
+            'success': False,
+            'messages': [{'msg': 'RR 192.0.2.1 not found'}]
+        })
+        mock_response.text = mock_response.content.decode()
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(
+                **dict(self.solidserver_opts, batch_api=True))
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            existing = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.1'),
+                ]),
+            )
+            desired = objects.RecordSet(
+                name='www.example.com.',
+                type='A',
+                ttl=300,
+                records=objects.RecordList(objects=[
+                    objects.Record(data='192.0.2.2'),
+                ]),
+            )
+            
+            self.assertRaises(
+                exceptions.BackendException,
+                backend.update_recordset, None, zone, desired,
+                (desired, existing)
+            )
+            mock_session.request.assert_called_once()
+            self.assertTrue(backend._patch_supported)
+
+    @mock.patch('solidserver_backend.requests.Session')
+    def test_sync_caches_matching_zone_only(self, mock_session_class):
+        """Test sync only caches the ID of the zone and space it looked up"""
+        mock_session = mock.MagicMock()
+        mock_session_class.return_value = mock_session
+        
+        mock_response = mock.MagicMock()
+        mock_response.content = orjson.dumps({
+            'success': True,
+            'data': [{'zone_id': '7', 'zone_name': 'other.example.net',
+                      'zone_space_name': 'local'}],
+            'messages': []
+        })
+        mock_session.request.return_value = mock_response
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock_session
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            
+            backend.sync(None, zone)
+            
+            params = mock_session.request.call_args[1]['params']
+            self.assertEqual(params['where'], "zone_name='example.com'")
+            self.assertNotIn('example.com', backend._zone_id_cache)
+            
+            # Same name, but in another space
+            mock_response.content = orjson.dumps({
+                'success': True,
+                'data': [{'zone_id': '9', 'zone_name': 'example.com',
+                          'zone_space_name': 'other'}],
+                'messages': []
+            })
+            
+            backend.sync(None, zone)
+            
+            self.assertNotIn('example.com', backend._zone_id_cache)
+            
+            mock_response.content = orjson.dumps({
+                'success': True,
+                'data': [{'zone_id': '8', 'zone_name': 'example.com',
+                          'zone_space_name': 'local'}],
+                'messages': []
+            })
+            
+            backend.sync(None, zone)
+            
+            self.assertEqual(backend._zone_id_cache['example.com'], '8')
+
+    def test_request_empty_body(self):
+        """Test an empty successful response is treated as an empty result"""
+        mock_response = mock.MagicMock()
+        mock_response.ok = True
+        mock_response.status_code = 204
+        mock_response.content = b''
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock.MagicMock()
+            backend.session.request.return_value = mock_response
+            
+            result = backend._request('DELETE', '/dns/rr/delete')
+            
+            self.assertEqual(result, {'success': True, 'data': []})
+
+    def test_request_http_error(self):
+        """Test non-2xx responses raise with the status and body snippet"""
+        mock_response = mock.MagicMock()
+        mock_response.ok = False
+        mock_response.status_code = 500
+        mock_response.text = 'Internal error ' + 'x' * 1000
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock.MagicMock()
+            backend.session.request.return_value = mock_response
+            
+            for status in (404, 500):
+                mock_response.status_code = status
+                try:
+                    backend._request('POST', '/dns/rr/add', data={})
+                except solidserver_backend.EndpointNotSupported:
+                    self.fail('HTTP %d reported as unsupported' % status)
+                except exceptions.BackendException as e:
+                    self.assertEqual(
+                        str(e), '%d: %s' % (status, mock_response.text[:256]))
+                else:
+                    self.fail('HTTP %d did not raise' % status)
+
+    def test_request_not_supported(self):
+        """Test HTTP 405 and 501 are mapped to EndpointNotSupported"""
+        mock_response = mock.MagicMock()
+        mock_response.ok = False
+        mock_response.text = 'Method Not Allowed'
+        
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock.MagicMock()
+            backend.session.request.return_value = mock_response
+            
+            for status in (405, 501):
+                mock_response.status_code = status
+                self.assertRaises(
+                    solidserver_backend.EndpointNotSupported,
+                    backend._request, 'POST', '/dns/rr/add', data={}
+                )
+
+    def test_map_records_waits_and_raises_first_error(self):
+        """Test all record calls finish and the first error in order is raised"""
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.max_workers = 3
+            
+            done = []
+            
+            def func(record):
+                if record == 1:
+                    # Fails last, but comes first in record order
+                    time.sleep(0.05)
+                    done.append(record)
+                    raise exceptions.BackendException('record 1')
+                done.append(record)
+                if record == 3:
+                    raise exceptions.BackendException('record 3')
+            
+            with mock.patch('solidserver_backend.futures.ThreadPoolExecutor',
+                            wraps=futures.ThreadPoolExecutor) as executor:
+                self.assertRaisesRegex(
+                    exceptions.BackendException, '^record 1$',
+                    backend._map_records, func, range(5)
+                )
+            
+            self.assertEqual(sorted(done), [0, 1, 2, 3, 4])
+            executor.assert_called_once_with(max_workers=3)
+
+    def test_create_recordset_unsupported_type(self):
+        """Test recordset creation rejects record types other than A/AAAA"""
+        with mock.patch('solidserver_backend.CONF') as mock_conf:
+            mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
+            
+            backend = SolidServerBackend(None)
+            backend.session = mock.MagicMock()
+            
+            zone = objects.Zone(
+                id='zone-id',
+                name='example.com.',
+                type='PRIMARY',
+            )
+            recordset = objects.RecordSet(
+                name='example.com.',
+                type='MX',
+                records=objects.RecordList(objects=[
+                    objects.Record(data='10 mail.example.com.'),
+                ]),
+            )
+            
+            self.assertRaises(
+                exceptions.BackendException,
+                backend.create_recordset, None, zone, recordset
+            )
+            backend.session.request.assert_not_called()
+
     def test_build_rr_value_a_record(self):
         """Test A record value building"""
         with mock.patch('solidserver_backend.CONF') as mock_conf:
             mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
             
             backend = SolidServerBackend(None)
             
@@ -175,6 +959,7 @@ class SolidServerBackendTestCase(TestCase):
         """Test MX record value building"""
         with mock.patch('solidserver_backend.CONF') as mock_conf:
             mock_conf.__getitem__.return_value = mock.MagicMock(**self.config_opts)
+            mock_conf.solidserver = mock.MagicMock(**self.solidserver_opts)
             
             backend = SolidServerBackend(None)
             
@@ -186,5 +971,96 @@ class SolidServerBackendTestCase(TestCase):
             self.assertEqual(value, '10;mail.example.com.')
 
 
+class DnsCacheTestCase(TestCase):
+    """Test cases for the SOLIDserver host resolution cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super(DnsCacheTestCase, self).setUp()
+        
+        patcher = mock.patch.dict(solidserver_backend._DNS_CACHE, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.dict(solidserver_backend._DNS_CACHE_HOSTS,
+                                  {'sds.example.com': (60, 0.5)}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        patcher = mock.patch('solidserver_backend._create_connection')
+        self.create_connection = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch('solidserver_backend.socket.getaddrinfo')
+        self.getaddrinfo = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.getaddrinfo.return_value = [
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, '',
+             ('2001:db8::1', 443, 0, 0)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('192.0.2.1', 443)),
+        ]
+
+    def test_unregistered_host_passed_through(self):
+        """Test hosts without caching enabled use urllib3 unchanged"""
+        solidserver_backend._cached_create_connection(
+            ('other.example.com', 443), 5)
+        
+        self.create_connection.assert_called_once_with(
+            ('other.example.com', 443), 5)
+        self.getaddrinfo.assert_not_called()
+
+    def test_resolution_cached(self):
+        """Test a registered host is resolved once, then served from cache"""
+        solidserver_backend._cached_create_connection(
+            ('sds.example.com', 443), 5)
+        solidserver_backend._cached_create_connection(
+            ('sds.example.com', 443), 5)
+        
+        self.getaddrinfo.assert_called_once()
+        self.create_connection.assert_called_with(('2001:db8::1', 443), 5)
+
+    def test_next_address_tried(self):
+        """Test the next cached address is tried when one is unreachable"""
+        sock = mock.MagicMock()
+        self.create_connection.side_effect = [OSError('unreachable'), sock]
+        
+        result = solidserver_backend._cached_create_connection(
+            ('sds.example.com', 443), 5)
+        
+        self.assertIs(result, sock)
+        self.assertEqual(
+            [call[0][0] for call in self.create_connection.call_args_list],
+            [('2001:db8::1', 443), ('192.0.2.1', 443)]
+        )
+        self.assertIn('sds.example.com', solidserver_backend._DNS_CACHE)
+
+    def test_all_addresses_unreachable(self):
+        """Test the cache entry is dropped when no address accepts"""
+        self.create_connection.side_effect = OSError('unreachable')
+        
+        self.assertRaises(
+            OSError,
+            solidserver_backend._cached_create_connection,
+            ('sds.example.com', 443), 5
+        )
+        self.assertEqual(self.create_connection.call_count, 2)
+        self.assertNotIn('sds.example.com', solidserver_backend._DNS_CACHE)
+
+    @mock.patch('solidserver_backend.time.monotonic')
+    def test_resolution_failure_cached(self, mock_monotonic):
+        """Test resolution failures are cached for the error TTL only"""
+        self.getaddrinfo.side_effect = socket.gaierror(
+            socket.EAI_NONAME, 'Name or service not known')
+        
+        for now in (100.0, 100.4, 100.6):
+            mock_monotonic.return_value = now
+            self.assertRaises(
+                socket.gaierror,
+                solidserver_backend._cached_create_connection,
+                ('sds.example.com', 443), 5
+            )
+        
+        self.assertEqual(self.getaddrinfo.call_count, 2)
+        self.create_connection.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()